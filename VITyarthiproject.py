@@ -1,22 +1,71 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+from bisect import bisect_right
+from functools import lru_cache
 
 # --- Constants for Health Metrics ---
 
 # Standard BMI categories (WHO/CDC)
+# Upper bounds of each category, sorted so the category can be found with bisect
+_BMI_THRESHOLDS = (18.5, 25.0, 30.0, float('inf'))
+_BMI_NAMES = ('Underweight', 'Normal weight', 'Overweight', 'Obesity')
+
+# Key: category -> (min_bmi, max_bmi), kept for callers that read the ranges directly
 BMI_CATEGORIES = {
-    'Underweight': (0.0, 18.5),
-    'Normal weight': (18.5, 25.0),
-    'Overweight': (25.0, 30.0),
-    'Obesity': (30.0, float('inf'))
+    name: (_BMI_THRESHOLDS[i - 1] if i else 0.0, _BMI_THRESHOLDS[i])
+    for i, name in enumerate(_BMI_NAMES)
+}
+
+# Report layout pieces, built once rather than on every click
+REPORT_SEP = "=" * 50 + "\n"
+REPORT_DASH = "-" * 50 + "\n"
+REPORT_TITLE = "          COMPREHENSIVE HEALTH METRICS REPORT\n"
+HEADER_BMI_MEANING = "\n[ BMI Overall Meaning ]\n"
+HEADER_SLEEP = "\n[ Sleep Recommendation ]\n"
+HEADER_ACTIVITY = "\n[ Activity Recommendation ]\n"
+HEADER_SMOKING = "\n[ Smoking Status Advice ]\n"
+HEADER_GENERAL = "\n[ General Health & Diet Suggestions ]\n"
+
+# --- Advice Tables (built once at import) ---
+
+# Key: BMI category -> explanation of what the category means
+_BMI_EXPLANATIONS = {
+    'Underweight': "This range suggests you may not be consuming enough nutrients or calories. Consult a professional for healthy weight gain strategies.",
+    'Normal weight': "Your weight is considered healthy relative to your height, indicating a lower risk of common obesity-related diseases.",
+    'Overweight': "This range indicates carrying excess weight. A focus on diet and increased activity is recommended to reduce health risks.",
+    'Obesity': "This range is associated with a significantly increased risk for serious health conditions. Professional consultation for a weight management plan is strongly advised.",
+    'Unknown': "Could not determine a standard BMI meaning."
 }
 
-# General Sleep Recommendations by Age (National Sleep Foundation)
-# Key: (min_hours, max_hours)
-SLEEP_RECOMMENDATIONS = {
-    '18-64': (7, 9),
-    '65+': (7, 8)
+# Key: activity level -> feedback
+_ACTIVITY_FEEDBACK = {
+    'Sedentary': (
+        "Sedentary Lifestyle Detected. Recommendation: Aim to break up long periods of sitting (e.g., stand up every hour). "
+        "Start with 30 minutes of light activity (like walking) daily and gradually increase intensity to moderate."
+    ),
+    'Moderate': (
+        "Moderate Activity Level. Recommendation: You are meeting minimum guidelines! "
+        "To maximize benefits, ensure you incorporate strength training (2-3 times per week) alongside your cardio for muscle and bone health."
+    ),
+    'Active': (
+        "Active Lifestyle! Recommendation: Excellent work. To prevent injury and fatigue, ensure proper recovery time, nutrition, and hydration. "
+        "Consider mixing up your routines to engage different muscle groups."
+    ),
+    'Unknown': "Activity Recommendation: Could not determine specific advice."
+}
+
+# Key: smoking status -> advice
+_SMOKING_ADVICE = {
+    'Yes': (
+        "Smoking Status: Tobacco use is extremely detrimental to cardiovascular and respiratory health. "
+        "Health Priority: Seek support to quit smoking immediately. Resources like quit-lines or medical professionals can provide vital assistance."
+    ),
+    'No': (
+        "Smoking Status: Non-smoker. Excellent! "
+        "Recommendation: Maintain this status and avoid exposure to second-hand smoke to protect your long-term health."
+    ),
+    'Unknown': "Smoking Status: Unknown. Please confirm your smoking status for relevant advice."
 }
 
 # --- Core Calculation Functions (Copied from previous file) ---
@@ -38,37 +87,36 @@ def get_bmi_category(bmi):
     """
     Determines the BMI category based on the calculated BMI value.
     """
-    for category, (min_val, max_val) in BMI_CATEGORIES.items():
-        if min_val <= bmi < max_val:
-            return category, min_val, max_val
-    return "Unknown", 0.0, 0.0
+    if not bmi >= 0.0:  # also rejects NaN
+        return "Unknown", 0.0, 0.0
+    i = bisect_right(_BMI_THRESHOLDS, bmi)
+    if i == len(_BMI_THRESHOLDS):
+        return "Unknown", 0.0, 0.0
+    min_val = _BMI_THRESHOLDS[i - 1] if i else 0.0
+    return _BMI_NAMES[i], min_val, _BMI_THRESHOLDS[i]
 
 def get_bmi_explanation(category):
     """
     Provides a simple explanation of what the BMI category means.
     """
-    explanations = {
-        'Underweight': "This range suggests you may not be consuming enough nutrients or calories. Consult a professional for healthy weight gain strategies.",
-        'Normal weight': "Your weight is considered healthy relative to your height, indicating a lower risk of common obesity-related diseases.",
-        'Overweight': "This range indicates carrying excess weight. A focus on diet and increased activity is recommended to reduce health risks.",
-        'Obesity': "This range is associated with a significantly increased risk for serious health conditions. Professional consultation for a weight management plan is strongly advised.",
-        'Unknown': "Could not determine a standard BMI meaning."
-    }
-    return explanations.get(category, explanations['Unknown'])
+    return _BMI_EXPLANATIONS.get(category, _BMI_EXPLANATIONS['Unknown'])
 
 
 # --- Recommendation Functions (Copied from previous file) ---
 
+# The hours value is echoed in the text, so entries must not be shared between values that
+# compare equal but print differently: typed=True keeps 8 and 8.0 apart, and calculate_health
+# folds -0.0 into 0.0 before calling
+@lru_cache(maxsize=64, typed=True)
 def get_sleep_feedback(age, hours):
     """ Provides specific sleep recommendations based on age and hours slept. """
-    if 18 <= age <= 64:
-        age_group = '18-64'
-    elif age >= 65:
-        age_group = '65+'
-    else:
+    # General Sleep Recommendations by Age (National Sleep Foundation)
+    if age < 18:
         return "Note: Specific recommendations for minors/children are not included in this model."
-
-    min_h, max_h = SLEEP_RECOMMENDATIONS[age_group]
+    if age <= 64:
+        min_h, max_h, age_group = 7, 9, '18-64'
+    else:
+        min_h, max_h, age_group = 7, 8, '65+'
 
     if hours < min_h:
         return (
@@ -86,41 +134,19 @@ def get_sleep_feedback(age, hours):
             "Recommendation: Maintain this consistent sleep pattern for optimal health."
         )
 
+@lru_cache(maxsize=64)
 def get_activity_feedback(activity_level_str):
     """ Provides feedback based on the user's reported activity level. """
-    if activity_level_str == 'Sedentary':
-        return (
-            "Sedentary Lifestyle Detected. Recommendation: Aim to break up long periods of sitting (e.g., stand up every hour). "
-            "Start with 30 minutes of light activity (like walking) daily and gradually increase intensity to moderate."
-        )
-    elif activity_level_str == 'Moderate':
-        return (
-            "Moderate Activity Level. Recommendation: You are meeting minimum guidelines! "
-            "To maximize benefits, ensure you incorporate strength training (2-3 times per week) alongside your cardio for muscle and bone health."
-        )
-    elif activity_level_str == 'Active':
-        return (
-            "Active Lifestyle! Recommendation: Excellent work. To prevent injury and fatigue, ensure proper recovery time, nutrition, and hydration. "
-            "Consider mixing up your routines to engage different muscle groups."
-        )
-    return "Activity Recommendation: Could not determine specific advice."
+    return _ACTIVITY_FEEDBACK.get(activity_level_str, _ACTIVITY_FEEDBACK['Unknown'])
 
+@lru_cache(maxsize=64)
 def get_smoking_advice(smoking_status):
     """ Provides advice related to smoking status. """
-    if smoking_status == 'Yes':
-        return (
-            "Smoking Status: Tobacco use is extremely detrimental to cardiovascular and respiratory health. "
-            "Health Priority: Seek support to quit smoking immediately. Resources like quit-lines or medical professionals can provide vital assistance."
-        )
-    elif smoking_status == 'No':
-        return (
-            "Smoking Status: Non-smoker. Excellent! "
-            "Recommendation: Maintain this status and avoid exposure to second-hand smoke to protect your long-term health."
-        )
-    return "Smoking Status: Unknown. Please confirm your smoking status for relevant advice."
+    return _SMOKING_ADVICE.get(smoking_status, _SMOKING_ADVICE['Unknown'])
 
+@lru_cache(maxsize=64)
 def generate_health_recommendations(category):
-    """ Provides general health and activity advice based on BMI category. """
+    """ Provides general health and activity advice based on BMI category, as a tuple. """
     recommendations = [
         "General Wellness Tip: Aim for 5 servings of fruits and vegetables daily and minimize processed foods.",
         "Hydration Tip: Drink at least 8 glasses (about 2 liters) of water per day."
@@ -143,24 +169,23 @@ def generate_health_recommendations(category):
             "Health Priority: It is highly recommended to consult a healthcare provider for a personalized, safe, and effective plan. Focus on achievable, small, consistent changes."
         )
 
-    return recommendations
+    return tuple(recommendations)
 
 # --- Tkinter GUI Implementation ---
 
 class HealthCalculatorApp:
+    # Tcl interpreter whose ttk styles have already been configured. Holding a strong
+    # reference is deliberate: it keeps a destroyed root's interpreter alive until another
+    # root is styled, so a recycled object can never pass the identity check by accident
+    _styles_ready = None
+
     def __init__(self, master):
         self.master = master
         master.title("Personalized Health Guide")
         master.geometry("800x650")
         master.resizable(False, False)
         
-        # Configure style for a modern look
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
-        self.style.configure('TFrame', background='#f7f7f7')
-        self.style.configure('TLabel', background='#f7f7f7', font=('Arial', 10))
-        self.style.configure('TButton', font=('Arial', 10, 'bold'), padding=5)
-        self.style.map('TButton', background=[('active', '#e6e6e6')])
+        type(self)._ensure_styles_configured(master)
 
         # Input Frame
         self.input_frame = ttk.Frame(master, padding="20 20 20 10", relief='flat')
@@ -176,6 +201,21 @@ class HealthCalculatorApp:
 
         self.create_widgets()
 
+    @classmethod
+    def _ensure_styles_configured(cls, master):
+        """ Configures the ttk styles once per Tk interpreter; later windows reuse them. """
+        if cls._styles_ready is master.tk:
+            return
+
+        # Configure style for a modern look
+        style = ttk.Style(master)
+        style.theme_use('clam')
+        style.configure('TFrame', background='#f7f7f7')
+        style.configure('TLabel', background='#f7f7f7', font=('Arial', 10))
+        style.configure('TButton', font=('Arial', 10, 'bold'), padding=5)
+        style.map('TButton', background=[('active', '#e6e6e6')])
+        cls._styles_ready = master.tk
+
     def create_widgets(self):
         # Dictionary to hold input variables and entry widgets
         self.input_vars = {}
@@ -225,14 +265,12 @@ class HealthCalculatorApp:
     def calculate_health(self):
         """ Gathers input, performs calculations, and updates the results text area. """
         
-        self.results_text.delete(1.0, tk.END) # Clear previous results
-        
         try:
             # 1. Gather and Validate Input
             age = int(self.input_vars['age'].get())
             height_cm = float(self.input_vars['height_cm'].get())
             weight_kg = float(self.input_vars['weight_kg'].get())
-            sleep_hours = float(self.input_vars['sleep_hours'].get())
+            sleep_hours = float(self.input_vars['sleep_hours'].get()) + 0.0 # -0.0 -> 0.0
             activity_level_str = self.activity_var.get()
             smoking_status = self.smoking_var.get()
             
@@ -240,6 +278,7 @@ class HealthCalculatorApp:
                 raise ValueError("All numerical inputs must be positive.")
 
         except ValueError as e:
+            self.results_text.delete('1.0', tk.END) # Clear previous results
             messagebox.showerror("Input Error", f"Please check your input values: {e}. Ensure Age, Height, Weight, and Sleep are valid numbers.")
             return
         
@@ -252,47 +291,50 @@ class HealthCalculatorApp:
         bmi_meaning = get_bmi_explanation(category)
         
         # 4. Format Output Report
-        report = ""
-        report += "="*50 + "\n"
-        report += "          COMPREHENSIVE HEALTH METRICS REPORT\n"
-        report += "="*50 + "\n"
-        report += f"Age: {age} years\n"
-        report += f"Height: {height_cm:.1f} cm | Weight: {weight_kg:.1f} kg\n"
-        report += "-" * 50 + "\n"
-        report += f"Calculated BMI: {bmi:.2f}\n"
-        report += f"BMI Category: {category}\n"
-        report += f"(Ideal BMI Range: {min_val:.1f} to {max_val:.1f})\n"
+        parts = [
+            REPORT_SEP,
+            REPORT_TITLE,
+            REPORT_SEP,
+            f"Age: {age} years\n",
+            f"Height: {height_cm:.1f} cm | Weight: {weight_kg:.1f} kg\n",
+            REPORT_DASH,
+            f"Calculated BMI: {bmi:.2f}\n",
+            f"BMI Category: {category}\n",
+            f"(Ideal BMI Range: {min_val:.1f} to {max_val:.1f})\n",
+        ]
         
         # BMI Overall Meaning Block
-        report += "\n[ BMI Overall Meaning ]\n"
-        report += f"-> {bmi_meaning}\n"
-        report += "="*50 + "\n"
+        parts.append(HEADER_BMI_MEANING)
+        parts.append(f"-> {bmi_meaning}\n")
+        parts.append(REPORT_SEP)
 
         # 5. Generate and Display Recommendations
 
         # Sleep Recommendation
-        report += "\n[ Sleep Recommendation ]\n"
+        parts.append(HEADER_SLEEP)
         sleep_advice = get_sleep_feedback(age, sleep_hours)
-        report += f"-> {sleep_advice}\n"
+        parts.append(f"-> {sleep_advice}\n")
         
         # Activity Recommendation
-        report += "\n[ Activity Recommendation ]\n"
+        parts.append(HEADER_ACTIVITY)
         activity_advice = get_activity_feedback(activity_level_str)
-        report += f"-> {activity_advice}\n"
+        parts.append(f"-> {activity_advice}\n")
         
         # Smoking Advice
-        report += "\n[ Smoking Status Advice ]\n"
+        parts.append(HEADER_SMOKING)
         smoking_advice = get_smoking_advice(smoking_status)
-        report += f"-> {smoking_advice}\n"
+        parts.append(f"-> {smoking_advice}\n")
 
         # General Health & Diet Recommendation
-        report += "\n[ General Health & Diet Suggestions ]\n"
+        parts.append(HEADER_GENERAL)
         health_suggestions = generate_health_recommendations(category)
         for suggestion in health_suggestions:
-            report += f"-> {suggestion}\n"
+            parts.append(f"-> {suggestion}\n")
 
-        # Update the results text area
-        self.results_text.insert(tk.END, report)
+        # Swap in the new report with a single Tcl call; replace keeps the old scroll
+        # position, so jump back to the top of the report as delete+insert used to
+        self.results_text.replace('1.0', tk.END, "".join(parts))
+        self.results_text.yview_moveto(0)
 
 
 if __name__ == "__main__":